@@ -1,17 +1,36 @@
 #!/usr/bin/env python3
 
 import datetime
+import fnmatch
+import math
 import os
+import re
+import subprocess
 import sys
+import threading
 import time
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 try:
-    from kubernetes import client, config
+    from kubernetes import client, config, watch
     from kubernetes.client import CoreV1Api, V1NamespaceList, V1Pod
 except ImportError:
     client = None  # type: ignore
     config = None  # type: ignore
+    watch = None  # type: ignore
     CoreV1Api = None  # type: ignore
     V1Pod = None  # type: ignore
 from rich import box
@@ -24,6 +43,21 @@ console = Console()
 # 노드그룹 라벨을 변수로 분리 (기본값: node.kubernetes.io/app)
 NODE_GROUP_LABEL = "node.kubernetes.io/app"
 
+# 새로고침 간격(초) 기본값. 실제 간격은 RefreshScheduler가 변화율/지연에 맞춰 조정
+DEFAULT_REFRESH_INTERVAL = 2.0
+NODE_RESOURCE_REFRESH_INTERVAL = 1.0
+MIN_REFRESH_INTERVAL = 1.0
+MAX_REFRESH_INTERVAL = 30.0
+
+# namespace 단위로 나눠 조회할 때 동시에 보낼 최대 요청 수
+NAMESPACE_SHARD_CONCURRENCY = 8
+# Pod watch 한 번의 최대 유지 시간(초). 화면 종료 시 스레드가 늦어도 이 안에 정리됨
+POD_WATCH_TIMEOUT_SECONDS = 30
+# 전체 조회 403 여부와 Pod를 읽을 수 있는 namespace 목록을 다시 확인하는 주기(초)
+POD_ACCESS_CACHE_TTL = 300.0
+
+T = TypeVar("T")
+
 
 def cleanup() -> None:
     """리소스 정리 및 종료 전 후처리.
@@ -144,6 +178,71 @@ def choose_namespace() -> Optional[str]:
     return chosen_ns
 
 
+def _resolve_namespace_selection(selection: str, available: List[str]) -> List[str]:
+    """
+    콤마로 구분된 입력(번호, 이름, 와일드카드 패턴)을 namespace 목록으로 변환
+    예: "1,3", "team-a,team-b", "team-*"
+    """
+    chosen: List[str] = []
+    for token in (t.strip() for t in selection.split(",")):
+        if not token:
+            continue
+        if (
+            token.isdigit()
+            and token not in available
+            and 1 <= int(token) <= len(available)
+        ):
+            # 숫자로만 된 namespace 이름(예: 2024)과 겹치면 이름을 우선
+            matches = [available[int(token) - 1]]
+        elif any(ch in token for ch in "*?["):
+            matches = fnmatch.filter(available, token)
+        else:
+            matches = [token]
+        for ns in matches:
+            if ns not in chosen:
+                chosen.append(ns)
+    return chosen
+
+
+def choose_namespaces() -> Optional[List[str]]:
+    """
+    여러 namespace를 번호/이름/와일드카드 패턴(콤마 구분)으로 선택
+    아무 입력도 없으면 None(전체 조회, 권한이 없으면 읽을 수 있는 namespace로 분할 조회)
+    namespace 목록 조회 권한이 없어도 이름을 직접 입력할 수 있음
+    """
+    load_kube_config()
+    v1 = client.CoreV1Api()
+    available: List[str] = []
+    try:
+        available = [
+            str(ns.metadata.name) for ns in v1.list_namespace().items if ns.metadata
+        ]
+    except Exception as e:
+        print(f"Error fetching namespaces: {e}")
+        print("Namespace 이름을 직접 입력할 수 있습니다.")
+
+    if available:
+        table = Table(show_header=True, header_style="bold magenta", box=box.ROUNDED)
+        table.add_column("Index", style="bold green", width=5)
+        table.add_column("Namespace")
+        for idx, name in enumerate(available, start=1):
+            table.add_row(str(idx), name)
+        console.print("\n=== Available Namespaces ===", style="bold green")
+        console.print(table)
+
+    selection = Prompt.ask(
+        "조회할 Namespace 번호/이름/패턴을 입력하세요 (콤마 구분, 기본값: 전체)",
+        default="",
+    )
+    if not selection.strip():
+        return None
+    chosen = _resolve_namespace_selection(selection, available)
+    if not chosen:
+        print("일치하는 Namespace가 없습니다. 전체 조회로 진행합니다.")
+        return None
+    return chosen
+
+
 def choose_node_group() -> Optional[str]:
     """
     클러스터의 모든 노드 그룹 목록(NODE_GROUP_LABEL로부터) 표시 후, 사용자가 index로 선택
@@ -202,20 +301,691 @@ def get_tail_lines(prompt="몇 줄씩 확인할까요? (숫자 입력. default:
         return "20"
 
 
-def get_pods(v1_api: CoreV1Api, namespace: Optional[str] = None) -> List[V1Pod]:
+def _is_forbidden(exc: BaseException) -> bool:
+    """예외가 RBAC 권한 부족(403 Forbidden)인지 확인"""
+    return getattr(exc, "status", None) == 403
+
+
+def _can_list_pods(auth_api: Any, namespace: str) -> bool:
     """
-    지정된 namespace 또는 전체 namespace에서 Pod 목록을 가져옵니다.
+    SelfSubjectAccessReview로 namespace의 Pod list 권한 확인
+    판단할 수 없으면 True (실제 조회에서 403이 나면 그때 제외)
     """
+    review = client.V1SelfSubjectAccessReview(
+        spec=client.V1SelfSubjectAccessReviewSpec(
+            resource_attributes=client.V1ResourceAttributes(
+                namespace=namespace, verb="list", resource="pods"
+            )
+        )
+    )
     try:
-        if namespace:
-            return list(v1_api.list_namespaced_pod(namespace=namespace).items)
-        else:
+        result = auth_api.create_self_subject_access_review(review)
+        return bool(result.status.allowed)
+    except Exception:
+        return True
+
+
+def list_readable_namespaces(
+    v1_api: CoreV1Api, max_workers: int = NAMESPACE_SHARD_CONCURRENCY
+) -> List[str]:
+    """
+    사용자가 Pod를 조회할 수 있는 namespace 목록
+    namespace 목록 권한이 없으면(403) 현재 kube context의 namespace(없으면 default)
+    """
+    try:
+        candidates = [
+            str(ns.metadata.name) for ns in v1_api.list_namespace().items if ns.metadata
+        ]
+    except Exception as e:
+        if not _is_forbidden(e):
+            raise
+        try:
+            _, active = config.list_kube_config_contexts()
+            ns = (active or {}).get("context", {}).get("namespace")
+        except Exception:
+            ns = None
+        return [ns or "default"]
+    if not candidates:
+        return []
+    auth_api = client.AuthorizationV1Api()
+    workers = max(1, min(max_workers, len(candidates)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        allowed = list(
+            executor.map(lambda ns: _can_list_pods(auth_api, ns), candidates)
+        )
+    return [ns for ns, ok in zip(candidates, allowed) if ok]
+
+
+class _PodAccessCache:
+    """
+    Pod 조회 권한 캐시. 전체 namespace 조회가 403인지와 Pod를 읽을 수 있는 namespace
+    목록을 ttl 동안 기억해, 새로고침마다 같은 403 요청을 반복하지 않도록 합니다.
+    """
+
+    def __init__(
+        self,
+        ttl: float = POD_ACCESS_CACHE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._checked_at: Optional[float] = None
+        self._all_forbidden = False
+        self._readable: Optional[List[str]] = None
+        self._forbidden: List[str] = []
+
+    def _expire(self) -> None:
+        # 호출 측에서 self._lock을 잡은 상태로 사용
+        if (
+            self._checked_at is not None
+            and self._clock() - self._checked_at >= self._ttl
+        ):
+            self._checked_at = None
+            self._all_forbidden = False
+            self._readable = None
+            self._forbidden = []
+
+    def _touch(self) -> None:
+        if self._checked_at is None:
+            self._checked_at = self._clock()
+
+    def all_namespaces_forbidden(self) -> bool:
+        with self._lock:
+            self._expire()
+            return self._all_forbidden
+
+    def mark_all_namespaces_forbidden(self) -> None:
+        with self._lock:
+            self._all_forbidden = True
+            self._touch()
+
+    def readable_namespaces(self, v1_api: CoreV1Api) -> List[str]:
+        """캐시된 목록 반환. 없으면 list_readable_namespaces로 한 번 확인"""
+        with self._lock:
+            self._expire()
+            if self._readable is None:
+                self._readable = list_readable_namespaces(v1_api)
+                self._touch()
+            return list(self._readable)
+
+    def discard(self, namespaces: Sequence[str]) -> None:
+        """조회 중 403이 난 namespace를 목록에서 제외하고 건너뛴 namespace로 기록"""
+        with self._lock:
+            if self._readable is not None:
+                self._readable = [ns for ns in self._readable if ns not in namespaces]
+            for ns in namespaces:
+                if ns not in self._forbidden:
+                    self._forbidden.append(ns)
+            if namespaces:
+                self._touch()
+
+    def forbidden_namespaces(self, among: Optional[Sequence[str]] = None) -> List[str]:
+        """403으로 건너뛴 namespace 목록 (among이 있으면 그 안에서만)"""
+        with self._lock:
+            self._expire()
+            return [ns for ns in self._forbidden if among is None or ns in among]
+
+
+_pod_access = _PodAccessCache()
+
+
+def _shard_pods(
+    v1_api: CoreV1Api, namespaces: Sequence[str], max_workers: int
+) -> Tuple[List[V1Pod], Dict[str, BaseException]]:
+    """
+    namespace별 Pod 조회를 동시에 실행하고 입력 순서대로 병합
+    403인 namespace는 (namespace -> 예외)로 따로 돌려주고, 그 외 오류는 다시 던집니다.
+    """
+    if not namespaces:
+        return [], {}
+    workers = max(1, min(max_workers, len(namespaces)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(v1_api.list_namespaced_pod, namespace=ns)
+            for ns in namespaces
+        ]
+        pods: List[V1Pod] = []
+        forbidden: Dict[str, BaseException] = {}
+        unexpected: List[BaseException] = []
+        for ns, future in zip(namespaces, futures):
+            try:
+                pods.extend(future.result().items)
+            except Exception as e:
+                if _is_forbidden(e):
+                    forbidden[ns] = e
+                else:
+                    unexpected.append(e)
+    if unexpected:
+        raise unexpected[0]
+    return pods, forbidden
+
+
+def list_pods_sharded(
+    v1_api: CoreV1Api,
+    namespaces: Sequence[str],
+    max_workers: int = NAMESPACE_SHARD_CONCURRENCY,
+) -> List[V1Pod]:
+    """
+    namespace별 Pod 조회를 최대 max_workers개까지 동시에 실행하고 입력 순서대로 병합
+    전체 소요 시간은 가장 느린 namespace에 맞춰지며, 403인 namespace는 건너뜁니다.
+    모든 namespace가 403이거나 403 외의 오류(429 등)가 있으면 오류를 다시 던집니다.
+    """
+    pods, forbidden = _shard_pods(v1_api, namespaces, max_workers)
+    if forbidden and len(forbidden) == len(namespaces):
+        raise next(iter(forbidden.values()))
+    return pods
+
+
+def _list_pods_in(v1_api: CoreV1Api, namespaces: Sequence[str]) -> List[V1Pod]:
+    """
+    여러 namespace를 분할 조회하고 403인 namespace는 _pod_access에 기록
+    (forbidden_namespaces로 화면에 표시). 읽을 수 있는 namespace가 없으면 예외
+    """
+    if not namespaces:
+        raise RuntimeError("Pod를 조회할 수 있는 namespace가 없습니다.")
+    pods, forbidden = _shard_pods(v1_api, namespaces, NAMESPACE_SHARD_CONCURRENCY)
+    _pod_access.discard(list(forbidden))
+    if len(forbidden) == len(namespaces):
+        raise RuntimeError(
+            "선택한 모든 namespace에서 Pod 조회 권한이 없습니다(403): "
+            + ", ".join(forbidden)
+        )
+    return pods
+
+
+def _list_pods(
+    v1_api: CoreV1Api, namespace: Union[str, Sequence[str], None] = None
+) -> List[V1Pod]:
+    """
+    get_pods의 예외를 삼키지 않는 버전. RefreshScheduler가 429 등을 판별할 때 사용
+    전체 조회가 403이면 읽을 수 있는 namespace로 나눠 동시에 조회하며, 403 여부와
+    namespace 목록은 _pod_access에 캐시해 새로고침마다 다시 확인하지 않습니다.
+    """
+    if isinstance(namespace, str):
+        return list(v1_api.list_namespaced_pod(namespace=namespace).items)
+    if namespace:
+        return _list_pods_in(v1_api, namespace)
+    if not _pod_access.all_namespaces_forbidden():
+        try:
             return list(v1_api.list_pod_for_all_namespaces().items)
+        except Exception as e:
+            if not _is_forbidden(e):
+                raise
+            _pod_access.mark_all_namespaces_forbidden()
+    return _list_pods_in(v1_api, _pod_access.readable_namespaces(v1_api))
+
+
+def _print_skipped_namespaces(namespaces: Optional[Sequence[str]] = None) -> None:
+    """권한 없음(403)으로 건너뛴 namespace가 있으면 표시"""
+    skipped = _pod_access.forbidden_namespaces(namespaces)
+    if skipped:
+        console.print(
+            f"권한 없음(403)으로 건너뛴 namespace: {', '.join(skipped)}",
+            style="bold yellow",
+        )
+
+
+def get_pods(
+    v1_api: CoreV1Api, namespace: Union[str, Sequence[str], None] = None
+) -> List[V1Pod]:
+    """
+    지정된 namespace(여러 개 가능) 또는 전체 namespace에서 Pod 목록을 가져옵니다.
+    """
+    try:
+        return _list_pods(v1_api, namespace)
     except Exception as e:
         print(f"Error fetching pods: {e}")
         return []
 
 
+def _pods_fingerprint(pods: List[V1Pod]) -> Any:
+    """Pod 목록의 변경 여부 판단용 지문 (uid + resourceVersion)"""
+    return tuple(
+        sorted(
+            (getattr(p.metadata, "uid", None) or "", p.metadata.resource_version or "")
+            for p in pods
+            if p.metadata
+        )
+    )
+
+
+class ThrottledError(Exception):
+    """API 서버가 요청을 제한(429 TooManyRequests)했음을 나타내는 예외"""
+
+    def __init__(self, message: str, retry_after: float = 0.0) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _throttle_retry_after(exc: BaseException) -> Optional[float]:
+    """
+    예외가 API 서버 스로틀링(429)이면 Retry-After(초, 없으면 0)를, 아니면 None 반환
+    kubernetes ApiException은 status/headers 속성으로 판별합니다.
+    """
+    if isinstance(exc, ThrottledError):
+        return exc.retry_after
+    if getattr(exc, "status", None) != 429:
+        return None
+    headers = getattr(exc, "headers", None) or {}
+    try:
+        return max(0.0, float(headers.get("Retry-After", 0)))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class _RefreshState:
+    """RefreshScheduler가 리소스 키별로 유지하는 상태"""
+
+    def __init__(self, interval: float) -> None:
+        self.lock = threading.Lock()
+        self.interval = interval
+        self.next_due = 0.0
+        self.has_value = False
+        self.value: Any = None
+        self.fingerprint: Any = None
+        self.last_latency = 0.0
+
+
+class RefreshScheduler:
+    """
+    화면별 적응형 새로고침 스케줄러
+
+    - 결과가 바뀌면 간격을 줄이고(최소 min_interval), 그대로면 점차 늘림(최대 max_interval)
+    - API 응답이 느리면 간격을 지연 시간의 latency_factor 배 이상으로 유지
+    - 429(TooManyRequests)나 오류 시 간격을 두 배로 늘리고 Retry-After를 존중
+    - 간격이 지나기 전의 fetch는 캐시된 결과를 반환
+      (화면을 새로 열 때는 reset으로 이전 세션의 캐시와 간격을 버림)
+    """
+
+    def __init__(
+        self,
+        min_interval: float = MIN_REFRESH_INTERVAL,
+        max_interval: float = MAX_REFRESH_INTERVAL,
+        latency_factor: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.latency_factor = latency_factor
+        self._clock = clock
+        self._states: Dict[Hashable, _RefreshState] = {}
+        self._states_lock = threading.Lock()
+
+    def _state(self, key: Hashable, base_interval: float) -> _RefreshState:
+        with self._states_lock:
+            state = self._states.get(key)
+            if state is None:
+                state = _RefreshState(self._clamp(base_interval))
+                self._states[key] = state
+            return state
+
+    def _clamp(self, interval: float) -> float:
+        return min(self.max_interval, max(self.min_interval, interval))
+
+    def reset(self, key: Hashable) -> None:
+        """key의 캐시된 결과와 조정된 간격을 버림 (다음 fetch는 기본 간격으로 새로 조회)"""
+        with self._states_lock:
+            self._states.pop(key, None)
+
+    def interval(self, key: Hashable) -> float:
+        """현재 키에 적용 중인 새로고침 간격(초)"""
+        state = self._states.get(key)
+        return state.interval if state else self.min_interval
+
+    def next_delay(self, key: Hashable) -> float:
+        """다음 조회까지 남은 시간(초)"""
+        state = self._states.get(key)
+        if state is None:
+            return 0.0
+        return max(0.0, state.next_due - self._clock())
+
+    def fetch(
+        self,
+        key: Hashable,
+        fetcher: Callable[[], T],
+        base_interval: float = DEFAULT_REFRESH_INTERVAL,
+        fingerprint: Callable[[T], Any] = lambda value: value,
+    ) -> T:
+        """
+        key의 결과를 반환합니다. 아직 간격이 지나지 않았다면 캐시된 결과를 그대로
+        돌려주고, 지났다면 fetcher를 호출한 뒤 간격을 조정합니다.
+        스로틀링 시 이전 결과가 있으면 그것을 반환하고, 없으면 예외를 다시 던집니다.
+        """
+        state = self._state(key, base_interval)
+        with state.lock:
+            if state.has_value and self._clock() < state.next_due:
+                return cast(T, state.value)
+
+            started = self._clock()
+            try:
+                value = fetcher()
+            except Exception as e:
+                retry_after = _throttle_retry_after(e)
+                state.interval = self._clamp(state.interval * 2)
+                if retry_after is not None:
+                    state.interval = max(state.interval, retry_after)
+                state.next_due = self._clock() + state.interval
+                if retry_after is not None and state.has_value:
+                    return cast(T, state.value)
+                raise
+            finished = self._clock()
+
+            new_fingerprint = fingerprint(value)
+            if state.has_value and new_fingerprint == state.fingerprint:
+                interval = state.interval * 1.5
+            else:
+                interval = state.interval / 2 if state.has_value else state.interval
+            state.last_latency = finished - started
+            interval = max(interval, state.last_latency * self.latency_factor)
+            state.interval = self._clamp(interval)
+            state.value = value
+            state.fingerprint = new_fingerprint
+            state.has_value = True
+            state.next_due = finished + state.interval
+            return value
+
+
+# 모든 화면이 사용하는 스케줄러 인스턴스 (화면별로 키를 나눠 사용)
+refresh_scheduler = RefreshScheduler()
+
+
+def _is_kubectl_throttled(stderr: str) -> bool:
+    """kubectl 에러 출력이 API 서버 스로틀링(429)을 나타내는지 확인"""
+    return "TooManyRequests" in stderr or "too many requests" in stderr.lower()
+
+
+# kubectl의 상대 시간 표기(45s, 5m10s, 2d3h, <invalid>)와 RESTARTS의 "(5m ago)"
+_KUBECTL_AGE_TOKEN = re.compile(r"^(?:(?:\d+[smhdy])+|<invalid>|<unknown>)$")
+_KUBECTL_AGO = re.compile(r"\(\S+ ago\)")
+
+
+def _kubectl_output_fingerprint(output: str) -> Any:
+    """
+    kubectl 출력의 변경 여부 판단용 지문
+    폴링마다 바뀌는 AGE/LAST SEEN 등 상대 시간 토큰과 열 정렬 공백을 무시합니다.
+    """
+    return tuple(
+        " ".join(
+            token
+            for token in _KUBECTL_AGO.sub("", line).split()
+            if not _KUBECTL_AGE_TOKEN.match(token)
+        )
+        for line in output.splitlines()
+    )
+
+
+def _kubectl_top_fingerprint(output: str) -> Any:
+    """
+    `kubectl top` 출력용 지문. 상대 시간 열이 없고 CPU 밀리코어(250m 등)가 시간 표기와
+    같은 모양이므로 열 정렬 공백만 무시합니다.
+    """
+    return tuple(tuple(line.split()) for line in output.splitlines())
+
+
+def _run_shell_snapshot(cmd: str) -> str:
+    """셸 명령어(kubectl 파이프라인)를 한 번 실행하고 출력 반환"""
+    result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+    if _is_kubectl_throttled(result.stderr):
+        raise ThrottledError(result.stderr.strip())
+    return result.stdout + result.stderr
+
+
+def run_watch_command(
+    cmd: str,
+    base_interval: float = DEFAULT_REFRESH_INTERVAL,
+    fingerprint: Callable[[str], Any] = _kubectl_output_fingerprint,
+) -> None:
+    """
+    `watch -nN` 대신 RefreshScheduler가 정한 간격으로 명령어를 반복 실행
+    fingerprint로 출력 변경 여부를 판단하며, Ctrl+C로 중지하면 메뉴로 돌아갑니다.
+    """
+    console.print(
+        f"\n실행 명령어: [green]{cmd}[/green]\n(Ctrl+C로 중지)\n", style="bold"
+    )
+    refresh_scheduler.reset(cmd)
+    try:
+        while True:
+            try:
+                output = refresh_scheduler.fetch(
+                    cmd,
+                    lambda: _run_shell_snapshot(cmd),
+                    base_interval=base_interval,
+                    fingerprint=fingerprint,
+                )
+            except ThrottledError as e:
+                output = f"API 서버 요청 제한(429): {e}\n"
+            console.clear()
+            console.print(
+                f"Every {refresh_scheduler.interval(cmd):.1f}s: {cmd}", style="dim"
+            )
+            console.print(output, markup=False, highlight=False, end="")
+            time.sleep(refresh_scheduler.next_delay(cmd))
+    except KeyboardInterrupt:
+        console.print("\n메뉴로 돌아갑니다...", style="bold yellow")
+
+
+def _to_datetime(value: Any) -> Optional[datetime.datetime]:
+    """kubernetes 타임스탬프(datetime 또는 ISO 문자열)를 datetime으로 변환"""
+    if value is None or isinstance(value, datetime.datetime):
+        return value
+    return datetime.datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+
+
+class QuantileSketch:
+    """
+    로그 버킷 히스토그램 기반의 스트리밍 분위수 추정기 (DDSketch 방식)
+    값을 상대 오차 relative_accuracy 이내로 추정하며, 버킷 수가 max_buckets를 넘으면
+    가장 작은 버킷끼리 합쳐 메모리를 고정합니다.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.02, max_buckets: int = 512) -> None:
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._max_buckets = max_buckets
+        self._buckets: Dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """값 하나를 추가 (음수는 0으로 취급)"""
+        self.count += 1
+        if value <= 0:
+            self._zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        if len(self._buckets) > self._max_buckets:
+            lowest, second = sorted(self._buckets)[:2]
+            self._buckets[second] += self._buckets.pop(lowest)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q(0~1) 분위수 추정값. 값이 없으면 None"""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return 0.0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if rank < seen:
+                return 2 * self._gamma**index / (self._gamma + 1)
+        return 2 * self._gamma ** max(self._buckets) / (self._gamma + 1)
+
+
+def _condition_time(pod: V1Pod, condition_type: str) -> Optional[datetime.datetime]:
+    """Pod condition이 True가 된 시각 (없으면 None)"""
+    for cond in getattr(pod.status, "conditions", None) or []:
+        if cond.type == condition_type and cond.status == "True":
+            return _to_datetime(cond.last_transition_time)
+    return None
+
+
+class PodLifecycleTracker:
+    """
+    Pod watch 이벤트로부터 생성→스케줄(PodScheduled), 스케줄→ContainersReady 지연을
+    (namespace, node group)별 QuantileSketch에 누적합니다. Pod마다 단계별로 한 번만 기록하며,
+    since 이전에 생성된 Pod는 무시합니다. 노드 그룹을 알 수 없는 Pod의 지연은 아직
+    기록하지 않고 다음 이벤트에서 다시 시도합니다.
+    ContainersReady 시각은 컨테이너 재시작 후 다시 Ready가 될 때마다 바뀌므로, 처음
+    관찰했을 때 이미 재시작한 Pod는 ready 단계를 기록하지 않습니다.
+    """
+
+    STAGES = ("scheduled", "ready")
+    TERMINAL_PHASES = ("Succeeded", "Failed")
+
+    def __init__(
+        self,
+        node_group_of: Callable[[str], Optional[str]],
+        since: Optional[datetime.datetime] = None,
+    ) -> None:
+        self._node_group_of = node_group_of
+        self._since = since
+        self._lock = threading.Lock()
+        self._sketches: Dict[tuple, Dict[str, QuantileSketch]] = {}
+        # uid -> (namespace, node group, 기록(또는 생략)한 단계, 종료 여부, Ready 여부)
+        # DELETED 이벤트와 resync에서 제거되므로 살아있는 Pod 수로 제한됨
+        self._pods: Dict[str, tuple] = {}
+
+    def observe(self, event_type: str, pod: V1Pod) -> None:
+        """watch 이벤트(ADDED/MODIFIED/DELETED) 하나를 반영"""
+        meta = pod.metadata
+        if meta is None:
+            return
+        uid = str(meta.uid)
+        if event_type == "DELETED":
+            with self._lock:
+                self._pods.pop(uid, None)
+            return
+        created = _to_datetime(meta.creation_timestamp)
+        if created is None or (self._since and created < self._since):
+            return
+        namespace = str(meta.namespace)
+        node_name = getattr(pod.spec, "node_name", None)
+        # 노드 조회(API 호출)는 락 밖에서 수행해 rows()가 막히지 않도록 함
+        node_group = self._node_group_of(node_name) if node_name else None
+        terminal = getattr(pod.status, "phase", None) in self.TERMINAL_PHASES
+        scheduled = _condition_time(pod, "PodScheduled")
+        ready = _condition_time(pod, "ContainersReady")
+        restarts = sum(
+            c.restart_count or 0
+            for c in getattr(pod.status, "container_statuses", None) or []
+        )
+        with self._lock:
+            entry = self._pods.get(uid)
+            recorded = entry[2] if entry else frozenset()
+            if entry is None and restarts:
+                recorded = recorded | {"ready"}
+            latencies = {}
+            if node_group is not None and scheduled:
+                if "scheduled" not in recorded:
+                    latencies["scheduled"] = (scheduled - created).total_seconds()
+                if ready and "ready" not in recorded:
+                    latencies["ready"] = (ready - scheduled).total_seconds()
+            if latencies:
+                sketches = self._sketches.setdefault(
+                    (namespace, node_group),
+                    {stage: QuantileSketch() for stage in self.STAGES},
+                )
+                for stage, latency in latencies.items():
+                    sketches[stage].add(latency)
+            # 종료된 Pod도 재연결 시 다시 집계되지 않도록 기록은 유지하되 Pending에서는 제외
+            self._pods[uid] = (
+                namespace,
+                node_group or "-",
+                recorded | frozenset(latencies),
+                terminal,
+                ready is not None,
+            )
+
+    def resync(self, pods: List[V1Pod], namespace: Optional[str] = None) -> None:
+        """
+        새 list 결과로 상태를 맞춤. 목록에 없는 Pod(해당 namespace 범위)는
+        watch가 끊긴 사이 삭제된 것으로 보고 제거합니다.
+        """
+        for pod in pods:
+            self.observe("ADDED", pod)
+        live = {str(p.metadata.uid) for p in pods if p.metadata}
+        with self._lock:
+            for uid, entry in list(self._pods.items()):
+                if uid not in live and namespace in (None, entry[0]):
+                    del self._pods[uid]
+
+    def rows(self) -> List[tuple]:
+        """
+        (namespace, node group, 대기 중 Pod 수, {stage: (count, p50, p90, p99)}) 목록
+        """
+        with self._lock:
+            pending: Dict[tuple, int] = {}
+            for namespace, node_group, _, terminal, is_ready in self._pods.values():
+                if not terminal and not is_ready:
+                    group = (namespace, node_group)
+                    pending[group] = pending.get(group, 0) + 1
+            rows = []
+            for group in sorted(set(self._sketches) | set(pending)):
+                sketches = self._sketches.get(group, {})
+                stats = {
+                    stage: (
+                        sketch.count,
+                        sketch.quantile(0.5),
+                        sketch.quantile(0.9),
+                        sketch.quantile(0.99),
+                    )
+                    for stage, sketch in sketches.items()
+                }
+                rows.append((group[0], group[1], pending.get(group, 0), stats))
+            return rows
+
+
+def _node_group_lookup(v1_api: CoreV1Api) -> Callable[[str], Optional[str]]:
+    """
+    노드 이름 -> NODE_GROUP_LABEL 값 조회 함수 생성
+    처음 보는 노드는 read_node로 바로 조회해 캐시합니다. 라벨이 없거나 노드 조회 권한이
+    없으면(403) "-", 일시적 오류로 알 수 없으면 None (캐시하지 않고 다음에 다시 조회)
+    """
+    groups: Dict[str, str] = {}
+    forbidden = threading.Event()
+
+    def lookup(node_name: str) -> Optional[str]:
+        if node_name in groups:
+            return groups[node_name]
+        if forbidden.is_set():
+            return "-"
+        try:
+            node = v1_api.read_node(node_name)
+        except Exception as e:
+            if _is_forbidden(e):
+                forbidden.set()
+                return "-"
+            return None
+        labels = (node.metadata.labels if node.metadata else None) or {}
+        groups[node_name] = labels.get(NODE_GROUP_LABEL, "-")
+        return groups[node_name]
+
+    return lookup
+
+
+def _pod_watch_targets(
+    v1_api: CoreV1Api, namespaces: Optional[List[str]]
+) -> List[Optional[str]]:
+    """
+    watch할 대상 목록 (None은 전체 namespace)
+    전체 조회가 403이면 _list_pods와 같이 읽을 수 있는 namespace별로 나눠 watch
+    """
+    if namespaces:
+        return list(namespaces)
+    if not _pod_access.all_namespaces_forbidden():
+        try:
+            v1_api.list_pod_for_all_namespaces(limit=1)
+            return [None]
+        except Exception as e:
+            if not _is_forbidden(e):
+                raise
+            _pod_access.mark_all_namespaces_forbidden()
+    return list(_pod_access.readable_namespaces(v1_api))
+
+
 def watch_event_monitoring() -> None:
     """
     1) Event Monitoring
@@ -231,13 +1001,10 @@ def watch_event_monitoring() -> None:
 
     ns_option = f"-n {ns}" if ns else "-A"
     if event_choice == "2":
-        cmd = f'watch -n2 "kubectl get events {ns_option} --field-selector type!=Normal --sort-by=".metadata.managedFields[].time" | tail -n {tail_num}"'
+        cmd = f'kubectl get events {ns_option} --field-selector type!=Normal --sort-by=".metadata.managedFields[].time" | tail -n {tail_num}'
     else:
-        cmd = f'watch -n2 "kubectl get events {ns_option} --sort-by=".metadata.managedFields[].time" | tail -n {tail_num}"'
-    console.print(
-        f"\n실행 명령어: [green]{cmd}[/green]\n(Ctrl+C로 중지)\n", style="bold"
-    )
-    os.system(cmd)
+        cmd = f'kubectl get events {ns_option} --sort-by=".metadata.managedFields[].time" | tail -n {tail_num}'
+    run_watch_command(cmd)
 
 
 def view_restarted_container_logs() -> None:
@@ -248,8 +1015,9 @@ def view_restarted_container_logs() -> None:
     console.print("\n[2] 재시작된 컨테이너 확인 및 로그 조회", style="bold blue")
     load_kube_config()
     v1 = client.CoreV1Api()
-    ns = choose_namespace()
+    ns = choose_namespaces()
     pods = get_pods(v1, ns)
+    _print_skipped_namespaces(ns)
     if not pods:
         return
 
@@ -328,13 +1096,10 @@ def watch_pod_monitoring_by_creation() -> None:
     tail_num = get_tail_lines("몇 줄씩 확인할까요? (예: 20): ")
     ns_option = f"-n {ns}" if ns else "-A"
     if extra.startswith("y"):
-        cmd = f'watch -n2 "kubectl get po {ns_option} -o wide --sort-by=.metadata.creationTimestamp | tail -n {tail_num}"'
+        cmd = f"kubectl get po {ns_option} -o wide --sort-by=.metadata.creationTimestamp | tail -n {tail_num}"
     else:
-        cmd = f'watch -n2 "kubectl get po {ns_option} --sort-by=.metadata.creationTimestamp | tail -n {tail_num}"'
-    console.print(
-        f"\n실행 명령어: [green]{cmd}[/green]\n(Ctrl+C로 중지)\n", style="bold"
-    )
-    os.system(cmd)
+        cmd = f"kubectl get po {ns_option} --sort-by=.metadata.creationTimestamp | tail -n {tail_num}"
+    run_watch_command(cmd)
 
 
 def watch_non_running_pod() -> None:
@@ -352,30 +1117,38 @@ def watch_non_running_pod() -> None:
     tail_num = get_tail_lines("몇 줄씩 확인할까요? (예: 20): ")
     ns_option = f"-n {ns}" if ns else "-A"
     if extra.startswith("y"):
-        cmd = f"watch -n2 \"kubectl get pods {ns_option} -o wide | grep -ivE ' Running' | tail -n {tail_num}\""
+        cmd = f"kubectl get pods {ns_option} -o wide | grep -ivE ' Running' | tail -n {tail_num}"
     else:
-        cmd = f"watch -n2 \"kubectl get pods {ns_option} | grep -ivE ' Running' | tail -n {tail_num}\""
-    console.print(
-        f"\n실행 명령어: [green]{cmd}[/green]\n(Ctrl+C로 중지)\n", style="bold"
-    )
-    os.system(cmd)
+        cmd = (
+            f"kubectl get pods {ns_option} | grep -ivE ' Running' | tail -n {tail_num}"
+        )
+    run_watch_command(cmd)
 
 
 def watch_pod_counts() -> None:
     """
-    5) Pod Monitoring - 전체/정상/비정상 Pod 개수 출력 (2초 간격)
-       namespace 지정 가능
+    5) Pod Monitoring - 전체/정상/비정상 Pod 개수 출력
+       namespace 지정 가능. 간격은 RefreshScheduler가 조정 (기본 2초)
     """
     console.print(
         "\n[5] Pod Monitoring (전체/정상/비정상 Pod 개수 출력)", style="bold blue"
     )
-    ns = choose_namespace()
+    ns = choose_namespaces()
     console.print("\n(Ctrl+C로 중지 후 메뉴로 돌아갑니다.)", style="bold yellow")
     load_kube_config()
     v1 = client.CoreV1Api()
     try:
+        key = ("pods", tuple(ns) if ns else None)
+        refresh_scheduler.reset(key)
         while True:
-            pods = get_pods(v1, ns)
+            error = ""
+            try:
+                pods = refresh_scheduler.fetch(
+                    key, lambda: _list_pods(v1, ns), fingerprint=_pods_fingerprint
+                )
+            except Exception as e:
+                error = f"Error fetching pods: {e}"
+                pods = []
             total = len(pods)
             normal = sum(
                 1
@@ -388,7 +1161,14 @@ def watch_pod_counts() -> None:
             console.print(f"Total Pods    : [green]{total}[/green]")
             console.print(f"Normal Pods   : [green]{normal}[/green]")
             console.print(f"Abnormal Pods : [red]{abnormal}[/red]")
-            time.sleep(2)
+            if error:
+                console.print(error, style="bold red", markup=False)
+            _print_skipped_namespaces(ns)
+            console.print(
+                f"\n(새로고침 간격: {refresh_scheduler.interval(key):.1f}초)",
+                style="dim",
+            )
+            time.sleep(refresh_scheduler.next_delay(key))
     except KeyboardInterrupt:
         console.print("\n메뉴로 돌아갑니다...", style="bold yellow")
 
@@ -413,21 +1193,18 @@ def watch_node_monitoring_by_creation() -> None:
     if filter_nodegroup:
         # label selector를 사용해서 정확히 일치하는 노드만 필터링
         cmd = (
-            f'watch -n2 "kubectl get nodes -l {NODE_GROUP_LABEL}={filter_nodegroup} '
+            f"kubectl get nodes -l {NODE_GROUP_LABEL}={filter_nodegroup} "
             f"-L topology.ebs.csi.aws.com/zone -L {NODE_GROUP_LABEL} "
-            f'--sort-by=.metadata.creationTimestamp | tail -n {tail_num}"'
+            f"--sort-by=.metadata.creationTimestamp | tail -n {tail_num}"
         )
     else:
         cmd_base = (
             f"kubectl get nodes -L topology.ebs.csi.aws.com/zone -L {NODE_GROUP_LABEL} "
             f"--sort-by=.metadata.creationTimestamp"
         )
-        cmd = f'watch -n2 "{cmd_base} | tail -n {tail_num}"'
+        cmd = f"{cmd_base} | tail -n {tail_num}"
 
-    console.print(
-        f"\n실행 명령어: [green]{cmd}[/green]\n(Ctrl+C로 중지)\n", style="bold"
-    )
-    os.system(cmd)
+    run_watch_command(cmd)
 
 
 def watch_unhealthy_nodes() -> None:
@@ -454,9 +1231,8 @@ def watch_unhealthy_nodes() -> None:
         cmd_base = f"kubectl get nodes -L topology.ebs.csi.aws.com/zone -L {NODE_GROUP_LABEL} --sort-by=.metadata.creationTimestamp"
 
     # 'Ready' 상태가 아닌 노드들만 표시
-    cmd = f"watch -n2 \"{cmd_base} | grep -ivE ' Ready ' | tail -n {tail_num}\""
-    console.print(f"실행 명령어: [green]{cmd}[/green]\n(Ctrl+C로 중지)\n", style="bold")
-    os.system(cmd)
+    cmd = f"{cmd_base} | grep -ivE ' Ready ' | tail -n {tail_num}"
+    run_watch_command(cmd)
 
 
 def watch_node_resources() -> None:
@@ -503,9 +1279,179 @@ def watch_node_resources() -> None:
 
     # sort -k3 or -k5 -nr로 정렬 후, head로 상위 N개만
     cmd += f" | sort -k{sort_column} -nr 2>/dev/null | head -n {top_n}"
-    cmd = f'watch -n1 "{cmd}"'
-    console.print(f"실행 명령어: [green]{cmd}[/green]\n(Ctrl+C로 중지)\n", style="bold")
-    os.system(cmd)
+    run_watch_command(
+        cmd,
+        base_interval=NODE_RESOURCE_REFRESH_INTERVAL,
+        fingerprint=_kubectl_top_fingerprint,
+    )
+
+
+def _format_latency(seconds: Optional[float]) -> str:
+    """지연(초)을 표 표시용 문자열로 변환"""
+    if seconds is None:
+        return "-"
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    return f"{int(seconds // 60)}m{int(seconds % 60):02d}s"
+
+
+def _close_watch(pod_watch: Any) -> None:
+    """watch 중지 플래그를 세우고 열린 응답을 닫아, 이벤트를 기다리던 스트림을 바로 끝냄"""
+    pod_watch.stop()
+    resp = getattr(pod_watch, "_resp", None)
+    if resp is not None:
+        try:
+            resp.close()
+        except Exception:
+            pass
+
+
+def watch_pod_lifecycle_latency() -> None:
+    """
+    9) Pod Lifecycle Latency (생성 → 스케줄 → ContainersReady)
+       Pod watch 스트림을 받아 namespace/NodeGroup별 지연 p50/p90/p99를 실시간으로 집계
+       전체 조회 권한이 없으면 읽을 수 있는 namespace별로 watch하며, namespace가
+       NAMESPACE_SHARD_CONCURRENCY개를 넘으면 watch 대신 분할 조회로 폴링
+    """
+    console.print(
+        "\n[9] Pod Lifecycle Latency (생성 → 스케줄 → ContainersReady)",
+        style="bold blue",
+    )
+    ns = choose_namespaces()
+    lookback = Prompt.ask("최근 몇 분 내 생성된 Pod부터 집계할까요?", default="10")
+    if not lookback.isdigit():
+        console.print("숫자가 아닙니다. 기본값 10분을 적용합니다.", style="bold red")
+        lookback = "10"
+    console.print("\n(Ctrl+C로 중지 후 메뉴로 돌아갑니다.)", style="bold yellow")
+    load_kube_config()
+    v1 = client.CoreV1Api()
+    try:
+        targets = _pod_watch_targets(v1, ns)
+    except Exception as e:
+        print(f"Error fetching pods: {e}")
+        return
+    since = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(
+        minutes=int(lookback)
+    )
+    tracker = PodLifecycleTracker(_node_group_lookup(v1), since=since)
+    stop = threading.Event()
+    watches: List[Any] = []
+    errors: Dict[str, str] = {}
+
+    def _consume(namespace: Optional[str]) -> None:
+        # 처음과 410 Gone 이후에는 다시 list 하여 resync, 그 외에는 마지막
+        # resourceVersion부터 이어서 watch
+        pod_watch = watch.Watch()
+        watches.append(pod_watch)
+        label = namespace or "*"
+        if namespace:
+            list_func: Callable[..., Any] = v1.list_namespaced_pod
+            kwargs: Dict[str, Any] = {"namespace": namespace}
+        else:
+            list_func = v1.list_pod_for_all_namespaces
+            kwargs = {}
+        resource_version: Optional[str] = None
+        backoff = 1.0
+        while not stop.is_set():
+            try:
+                if resource_version is None:
+                    pod_list = list_func(**kwargs)
+                    tracker.resync(pod_list.items, namespace)
+                    resource_version = pod_list.metadata.resource_version
+                for event in pod_watch.stream(
+                    list_func,
+                    resource_version=resource_version,
+                    timeout_seconds=POD_WATCH_TIMEOUT_SECONDS,
+                    **kwargs,
+                ):
+                    if stop.is_set():
+                        return
+                    tracker.observe(event["type"], event["object"])
+                    errors.pop(label, None)
+                    backoff = 1.0
+                resource_version = pod_watch.resource_version or resource_version
+            except Exception as e:
+                if stop.is_set():
+                    return
+                if getattr(e, "status", None) == 410:
+                    resource_version = None
+                    continue
+                errors[label] = str(e)
+                if namespace and _is_forbidden(e):
+                    _pod_access.discard([namespace])
+                    return
+                resource_version = pod_watch.resource_version or resource_version
+                retry_after = _throttle_retry_after(e) or 0.0
+                stop.wait(max(backoff, retry_after))
+                backoff = min(backoff * 2, MAX_REFRESH_INTERVAL)
+
+    def _poll() -> None:
+        # namespace가 많으면 namespace마다 watch 연결을 열지 않고, 제한된 동시성으로
+        # 분할 조회한 결과를 RefreshScheduler 간격으로 반영
+        key = ("pods", tuple(targets))
+        refresh_scheduler.reset(key)
+        while not stop.is_set():
+            try:
+                pods = refresh_scheduler.fetch(
+                    key,
+                    lambda: _list_pods(v1, [t for t in targets if t]),
+                    fingerprint=_pods_fingerprint,
+                )
+                tracker.resync(pods)
+                errors.pop("*", None)
+            except Exception as e:
+                errors["*"] = str(e)
+            stop.wait(refresh_scheduler.next_delay(key))
+
+    if len(targets) > NAMESPACE_SHARD_CONCURRENCY:
+        threads = [threading.Thread(target=_poll, daemon=True)]
+    else:
+        threads = [
+            threading.Thread(target=_consume, args=(target,), daemon=True)
+            for target in targets
+        ]
+    for thread in threads:
+        thread.start()
+    try:
+        while True:
+            table = Table(
+                show_header=True, header_style="bold magenta", box=box.ROUNDED
+            )
+            table.add_column("Namespace")
+            table.add_column("NodeGroup")
+            table.add_column("Pending", justify="right")
+            for label in ("Sched", "Ready"):
+                table.add_column(f"{label} N", justify="right")
+                for q in ("p50", "p90", "p99"):
+                    table.add_column(f"{label} {q}", justify="right")
+            for namespace, node_group, pending, stats in tracker.rows():
+                cells = [namespace, node_group, str(pending)]
+                for stage in PodLifecycleTracker.STAGES:
+                    count, *quantiles = stats.get(stage, (0, None, None, None))
+                    cells.append(str(count))
+                    cells.extend(_format_latency(v) for v in quantiles)
+                table.add_row(*cells)
+            console.clear()
+            console.print(
+                "=== Pod Lifecycle Latency (Sched: 생성→스케줄, "
+                "Ready: 스케줄→ContainersReady) ===",
+                style="bold blue",
+            )
+            console.print(table)
+            for label, message in sorted(errors.items()):
+                console.print(
+                    f"Watch error ({label}): {message}", style="bold red", markup=False
+                )
+            _print_skipped_namespaces([t for t in targets if t])
+            time.sleep(DEFAULT_REFRESH_INTERVAL)
+    except KeyboardInterrupt:
+        console.print("\n메뉴로 돌아갑니다...", style="bold yellow")
+    finally:
+        stop.set()
+        for pod_watch in list(watches):
+            _close_watch(pod_watch)
+        for thread in threads:
+            thread.join(timeout=1.0)
 
 
 def main_menu() -> str:
@@ -539,6 +1485,7 @@ def main_menu() -> str:
             "8",
             "Node Monitoring (CPU/Memory 사용량 높은 순 정렬) [NodeGroup 필터링 가능]",
         ),
+        ("9", "Pod Lifecycle Latency (생성→스케줄→Ready 지연 p50/p90/p99)"),
         ("Q", "Quit"),
     ]
 
@@ -574,6 +1521,8 @@ def main() -> None:
                 watch_unhealthy_nodes()
             elif choice == "8":
                 watch_node_resources()
+            elif choice == "9":
+                watch_pod_lifecycle_latency()
             elif choice.upper() == "Q":
                 _exit_with_cleanup(0, "정상 종료합니다.", style="bold green")
             else:
@@ -1,7 +1,11 @@
+import datetime
 import os
 import sys
+import threading
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
 import kubernetes_monitoring
 
@@ -71,3 +75,494 @@ def test_choose_namespace_failure(mock_load_config, mock_client):
 
     kubernetes_monitoring.choose_namespace()
     assert mock_load_config.called
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_refresh_scheduler_caches_fetches_within_interval():
+    """Test that fetches reuse the cached result until the interval elapses"""
+    clock = _FakeClock()
+    scheduler = kubernetes_monitoring.RefreshScheduler(clock=clock)
+    fetcher = MagicMock(return_value="pods")
+
+    assert scheduler.fetch("pods", fetcher, base_interval=2.0) == "pods"
+    assert scheduler.fetch("pods", fetcher, base_interval=2.0) == "pods"
+    fetcher.assert_called_once()
+
+    clock.now += scheduler.next_delay("pods")
+    scheduler.fetch("pods", fetcher, base_interval=2.0)
+    assert fetcher.call_count == 2
+
+
+def test_refresh_scheduler_adapts_to_change_rate():
+    """Test that the interval grows while idle and shrinks on change"""
+    clock = _FakeClock()
+    scheduler = kubernetes_monitoring.RefreshScheduler(clock=clock)
+
+    scheduler.fetch("k", lambda: "a", base_interval=2.0)
+    clock.now += 2.0
+    scheduler.fetch("k", lambda: "a", base_interval=2.0)
+    assert scheduler.interval("k") == 3.0
+
+    clock.now += 3.0
+    scheduler.fetch("k", lambda: "b", base_interval=2.0)
+    assert scheduler.interval("k") == 1.5
+
+
+def test_refresh_scheduler_backs_off_on_throttling():
+    """Test that a 429 keeps the previous result and honors Retry-After"""
+    clock = _FakeClock()
+    scheduler = kubernetes_monitoring.RefreshScheduler(clock=clock)
+    scheduler.fetch("k", lambda: "cached", base_interval=2.0)
+
+    throttled = Exception("Too Many Requests")
+    throttled.status = 429
+    throttled.headers = {"Retry-After": "10"}
+    clock.now += 2.0
+    result = scheduler.fetch("k", MagicMock(side_effect=throttled), base_interval=2.0)
+
+    assert result == "cached"
+    assert scheduler.interval("k") == 10.0
+
+
+def _api_error(status):
+    error = Exception(f"HTTP {status}")
+    error.status = status
+    return error
+
+
+def test_list_pods_sharded_merges_in_namespace_order_and_skips_forbidden():
+    """Test that sharded listing merges results and skips 403 namespaces"""
+    pods_by_ns = {"a": ["pod-a"], "c": ["pod-c1", "pod-c2"]}
+
+    def list_namespaced_pod(namespace):
+        if namespace == "b":
+            raise _api_error(403)
+        return MagicMock(items=pods_by_ns[namespace])
+
+    mock_v1 = MagicMock()
+    mock_v1.list_namespaced_pod.side_effect = list_namespaced_pod
+
+    pods = kubernetes_monitoring.list_pods_sharded(mock_v1, ["c", "b", "a"])
+    assert pods == ["pod-c1", "pod-c2", "pod-a"]
+
+
+def test_list_pods_sharded_raises_throttling_errors():
+    """Test that non-403 errors (e.g. 429) propagate to the scheduler"""
+    mock_v1 = MagicMock()
+    mock_v1.list_namespaced_pod.side_effect = _api_error(429)
+
+    with pytest.raises(Exception, match="429"):
+        kubernetes_monitoring.list_pods_sharded(mock_v1, ["a", "b"])
+
+
+def _namespace(name):
+    ns = MagicMock()
+    ns.metadata.name = name
+    return ns
+
+
+@patch("kubernetes_monitoring.client")
+def test_get_pods_falls_back_to_sharded_listing_when_forbidden(mock_client):
+    """Test that a 403 on all-namespace listing falls back to readable namespaces"""
+    with patch.object(
+        kubernetes_monitoring, "_pod_access", kubernetes_monitoring._PodAccessCache()
+    ):
+        mock_auth = mock_client.AuthorizationV1Api.return_value
+        mock_auth.create_self_subject_access_review.side_effect = [
+            MagicMock(status=MagicMock(allowed=True)),
+            MagicMock(status=MagicMock(allowed=False)),
+        ]
+        mock_v1 = MagicMock()
+        mock_v1.list_pod_for_all_namespaces.side_effect = _api_error(403)
+        mock_v1.list_namespace.return_value = MagicMock(
+            items=[_namespace("team-a"), _namespace("team-b")]
+        )
+        mock_v1.list_namespaced_pod.return_value = MagicMock(items=["pod"])
+
+        assert kubernetes_monitoring.get_pods(mock_v1) == ["pod"]
+        mock_v1.list_namespaced_pod.assert_called_once_with(namespace="team-a")
+
+
+@patch("kubernetes_monitoring.client")
+def test_get_pods_caches_forbidden_access_between_refreshes(mock_client):
+    """Test that repeated refreshes skip known 403s and pruned namespaces"""
+    mock_auth = mock_client.AuthorizationV1Api.return_value
+    mock_auth.create_self_subject_access_review.return_value = MagicMock(
+        status=MagicMock(allowed=True)
+    )
+
+    def list_namespaced_pod(namespace):
+        if namespace == "team-b":
+            raise _api_error(403)
+        return MagicMock(items=[f"pod-{namespace}"])
+
+    mock_v1 = MagicMock()
+    mock_v1.list_pod_for_all_namespaces.side_effect = _api_error(403)
+    mock_v1.list_namespace.return_value = MagicMock(
+        items=[_namespace("team-a"), _namespace("team-b")]
+    )
+    mock_v1.list_namespaced_pod.side_effect = list_namespaced_pod
+
+    with patch.object(
+        kubernetes_monitoring, "_pod_access", kubernetes_monitoring._PodAccessCache()
+    ):
+        assert kubernetes_monitoring.get_pods(mock_v1) == ["pod-team-a"]
+        mock_v1.list_namespaced_pod.reset_mock()
+        assert kubernetes_monitoring.get_pods(mock_v1) == ["pod-team-a"]
+
+    mock_v1.list_pod_for_all_namespaces.assert_called_once()
+    mock_v1.list_namespace.assert_called_once()
+    mock_v1.list_namespaced_pod.assert_called_once_with(namespace="team-a")
+
+
+def test_resolve_namespace_selection():
+    """Test index, name, and wildcard namespace selection"""
+    available = ["default", "team-a", "team-b"]
+    assert kubernetes_monitoring._resolve_namespace_selection(
+        "1, team-*, team-a, other", available
+    ) == ["default", "team-a", "team-b", "other"]
+
+
+def test_quantile_sketch_estimates_within_relative_accuracy():
+    """Test that the sketch keeps quantiles within its relative error bound"""
+    sketch = kubernetes_monitoring.QuantileSketch(relative_accuracy=0.02)
+    for value in range(1, 1001):
+        sketch.add(float(value))
+
+    assert sketch.count == 1000
+    assert abs(sketch.quantile(0.5) - 500) / 500 <= 0.03
+    assert abs(sketch.quantile(0.99) - 990) / 990 <= 0.03
+
+
+def test_quantile_sketch_bounds_memory():
+    """Test that the number of buckets never exceeds max_buckets"""
+    sketch = kubernetes_monitoring.QuantileSketch(max_buckets=16)
+    for exponent in range(200):
+        sketch.add(1.1**exponent)
+
+    assert len(sketch._buckets) <= 16
+    assert sketch.quantile(1.0) >= 1.1**199 * 0.9
+
+
+def _lifecycle_pod(
+    uid, scheduled_after=None, ready_after=None, phase="Pending", restarts=0
+):
+    created = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    conditions = []
+    for cond_type, offset in (
+        ("PodScheduled", scheduled_after),
+        ("ContainersReady", ready_after),
+    ):
+        if offset is not None:
+            conditions.append(
+                MagicMock(
+                    type=cond_type,
+                    status="True",
+                    last_transition_time=created + datetime.timedelta(seconds=offset),
+                )
+            )
+    pod = MagicMock()
+    pod.metadata.uid = uid
+    pod.metadata.namespace = "team-a"
+    pod.metadata.creation_timestamp = created
+    pod.spec.node_name = "node-1" if scheduled_after is not None else None
+    pod.status.conditions = conditions
+    pod.status.phase = phase
+    pod.status.container_statuses = [MagicMock(restart_count=restarts)]
+    return pod
+
+
+def test_pod_lifecycle_tracker_records_each_stage_once():
+    """Test that latencies are grouped by namespace/node group and not re-counted"""
+    tracker = kubernetes_monitoring.PodLifecycleTracker(
+        lambda node: "ng-1" if node else "-"
+    )
+
+    tracker.observe("ADDED", _lifecycle_pod("uid-1"))
+    tracker.observe("MODIFIED", _lifecycle_pod("uid-1", scheduled_after=3))
+    tracker.observe("MODIFIED", _lifecycle_pod("uid-1", 3, ready_after=13))
+    tracker.observe("MODIFIED", _lifecycle_pod("uid-1", 3, ready_after=13))
+
+    rows = {(ns, ng): (pending, stats) for ns, ng, pending, stats in tracker.rows()}
+    pending, stats = rows[("team-a", "ng-1")]
+    assert pending == 0
+    assert stats["scheduled"][0] == 1
+    assert abs(stats["scheduled"][1] - 3) < 0.1
+    assert stats["ready"][0] == 1
+    assert abs(stats["ready"][1] - 10) < 0.3
+
+
+def test_pod_lifecycle_tracker_tracks_pending_and_ignores_old_pods():
+    """Test pending counts, deletion cleanup, and the since cutoff"""
+    since = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    tracker = kubernetes_monitoring.PodLifecycleTracker(lambda node: "-", since=since)
+    tracker.observe("ADDED", _lifecycle_pod("uid-1"))
+    assert tracker.rows()[0][2] == 1
+
+    tracker.observe("DELETED", _lifecycle_pod("uid-1"))
+    assert tracker.rows() == []
+
+    late = kubernetes_monitoring.PodLifecycleTracker(
+        lambda node: "-", since=since + datetime.timedelta(minutes=1)
+    )
+    late.observe("ADDED", _lifecycle_pod("uid-2", 1, 2))
+    assert late.rows() == []
+
+
+def test_kubectl_fingerprint_ignores_age_columns():
+    """Test that output differing only in AGE/LAST SEEN lets the interval grow"""
+    outputs = [
+        "NAME    READY   STATUS    RESTARTS      AGE\n"
+        f"web-1   1/1     Running   1 ({age} ago)   {age}\n"
+        for age in ("9s", "11s", "1m5s", "10m")
+    ]
+    clock = _FakeClock()
+    scheduler = kubernetes_monitoring.RefreshScheduler(clock=clock)
+    fetcher = MagicMock(side_effect=outputs)
+
+    intervals = []
+    for _ in outputs:
+        scheduler.fetch(
+            "cmd",
+            fetcher,
+            base_interval=2.0,
+            fingerprint=kubernetes_monitoring._kubectl_output_fingerprint,
+        )
+        intervals.append(scheduler.interval("cmd"))
+        clock.now += scheduler.next_delay("cmd")
+
+    assert intervals == [2.0, 3.0, 4.5, 6.75]
+    assert kubernetes_monitoring._kubectl_output_fingerprint(
+        "web-1   1/1   Running\n"
+    ) != kubernetes_monitoring._kubectl_output_fingerprint("web-1   0/1   Pending\n")
+
+
+def test_refresh_scheduler_reset_forces_fresh_fetch():
+    """Test that reopening a view does not reuse the previous session's state"""
+    clock = _FakeClock()
+    scheduler = kubernetes_monitoring.RefreshScheduler(clock=clock)
+    fetcher = MagicMock(side_effect=["old", "new"])
+    scheduler.fetch("k", fetcher, base_interval=2.0)
+
+    scheduler.reset("k")
+
+    assert scheduler.fetch("k", fetcher, base_interval=2.0) == "new"
+    assert scheduler.interval("k") == 2.0
+
+
+def test_pod_lifecycle_tracker_excludes_finished_pods_from_pending():
+    """Test that Succeeded/Failed pods never count as pending"""
+    tracker = kubernetes_monitoring.PodLifecycleTracker(lambda node: "ng-1")
+    tracker.observe("ADDED", _lifecycle_pod("uid-1", 1, phase="Succeeded"))
+    tracker.observe("ADDED", _lifecycle_pod("uid-2", 1, phase="Failed"))
+
+    assert [row[2] for row in tracker.rows()] == [0]
+
+
+def test_pod_lifecycle_tracker_does_not_create_rows_before_scheduling():
+    """Test that an unscheduled pod only shows as pending, not as an empty row"""
+    tracker = kubernetes_monitoring.PodLifecycleTracker(lambda node: "ng-1")
+    tracker.observe("ADDED", _lifecycle_pod("uid-1"))
+    tracker.observe("MODIFIED", _lifecycle_pod("uid-1", 2, 4, phase="Running"))
+
+    rows = tracker.rows()
+    assert [(ns, ng, pending) for ns, ng, pending, _ in rows] == [("team-a", "ng-1", 0)]
+
+
+def test_pod_lifecycle_tracker_defers_unknown_node_group():
+    """Test that latencies wait until the node group can be resolved"""
+    groups = iter([None, "ng-new"])
+    tracker = kubernetes_monitoring.PodLifecycleTracker(lambda node: next(groups))
+    tracker.observe("MODIFIED", _lifecycle_pod("uid-1", 2, 4, phase="Running"))
+    tracker.observe("MODIFIED", _lifecycle_pod("uid-1", 2, 4, phase="Running"))
+
+    rows = tracker.rows()
+    assert [(ns, ng) for ns, ng, _, _ in rows] == [("team-a", "ng-new")]
+    assert rows[0][3]["ready"][0] == 1
+
+
+def test_pod_lifecycle_tracker_resync_drops_pods_missing_from_list():
+    """Test that pods deleted while the watch was down are forgotten on relist"""
+    tracker = kubernetes_monitoring.PodLifecycleTracker(lambda node: "ng-1")
+    tracker.observe("ADDED", _lifecycle_pod("uid-1"))
+    tracker.observe("ADDED", _lifecycle_pod("uid-2"))
+
+    tracker.resync([_lifecycle_pod("uid-2")], namespace="team-a")
+    assert tracker.rows()[0][2] == 1
+
+    tracker.resync([], namespace="other")
+    assert tracker.rows()[0][2] == 1
+
+
+@patch.object(kubernetes_monitoring, "_pod_access")
+def test_pod_watch_targets_fall_back_to_readable_namespaces(mock_access):
+    """Test that the latency view watches per namespace when listing all is 403"""
+    mock_access.all_namespaces_forbidden.return_value = False
+    mock_access.readable_namespaces.return_value = ["team-a", "team-b"]
+    mock_v1 = MagicMock()
+    mock_v1.list_pod_for_all_namespaces.side_effect = _api_error(403)
+
+    targets = kubernetes_monitoring._pod_watch_targets(mock_v1, None)
+
+    assert targets == ["team-a", "team-b"]
+    mock_access.mark_all_namespaces_forbidden.assert_called_once()
+    assert kubernetes_monitoring._pod_watch_targets(mock_v1, ["x"]) == ["x"]
+
+
+def test_kubectl_top_output_changes_are_detected():
+    """Test that CPU millicores in kubectl top output are not mistaken for ages"""
+    before = "node-1   250m   6%   1200Mi   15%\n"
+    after = "node-1   900m   6%   1200Mi   15%\n"
+    assert kubernetes_monitoring._kubectl_output_fingerprint(
+        before
+    ) == kubernetes_monitoring._kubectl_output_fingerprint(after)
+    assert kubernetes_monitoring._kubectl_top_fingerprint(
+        before
+    ) != kubernetes_monitoring._kubectl_top_fingerprint(after)
+
+
+@patch("kubernetes_monitoring.run_watch_command")
+@patch("kubernetes_monitoring.Prompt.ask", side_effect=["1", "20", "no"])
+def test_watch_node_resources_uses_top_fingerprint(mock_prompt, mock_run):
+    """Test that the node resource view does not ignore millicore changes"""
+    kubernetes_monitoring.watch_node_resources()
+
+    _, kwargs = mock_run.call_args
+    assert kwargs["fingerprint"] is kubernetes_monitoring._kubectl_top_fingerprint
+
+
+def test_resolve_namespace_selection_accepts_numeric_names():
+    """Test that all-digit namespace names can be typed by name"""
+    resolve = kubernetes_monitoring._resolve_namespace_selection
+    assert resolve("2024", ["a", "2024"]) == ["2024"]
+    assert resolve("2", ["a", "2024"]) == ["2024"]
+    assert resolve("2024", []) == ["2024"]
+
+
+def test_get_pods_reports_forbidden_explicit_namespaces(capsys):
+    """Test that 403 namespaces in an explicit selection are reported"""
+
+    def list_namespaced_pod(namespace):
+        if namespace == "team-b":
+            raise _api_error(403)
+        return MagicMock(items=["pod"])
+
+    mock_v1 = MagicMock()
+    mock_v1.list_namespaced_pod.side_effect = list_namespaced_pod
+
+    with patch.object(
+        kubernetes_monitoring, "_pod_access", kubernetes_monitoring._PodAccessCache()
+    ):
+        assert kubernetes_monitoring.get_pods(mock_v1, ["team-a", "team-b"]) == ["pod"]
+        kubernetes_monitoring._print_skipped_namespaces(["team-a", "team-b"])
+        assert kubernetes_monitoring.get_pods(mock_v1, ["team-b"]) == []
+
+    out = capsys.readouterr().out
+    assert "team-b" in out.splitlines()[0]
+    assert "Error fetching pods" in out
+
+
+def test_get_pods_errors_when_no_readable_namespace_left(capsys):
+    """Test that an empty readable set is reported instead of showing zero pods"""
+    access = kubernetes_monitoring._PodAccessCache()
+    access.mark_all_namespaces_forbidden()
+    mock_v1 = MagicMock()
+
+    with patch.object(kubernetes_monitoring, "_pod_access", access), patch.object(
+        kubernetes_monitoring, "list_readable_namespaces", return_value=[]
+    ):
+        assert kubernetes_monitoring.get_pods(mock_v1) == []
+
+    assert "namespace가 없습니다" in capsys.readouterr().out
+    mock_v1.list_namespaced_pod.assert_not_called()
+
+
+def test_pod_lifecycle_tracker_skips_ready_for_pods_first_seen_restarted():
+    """Test that a moved ContainersReady time after restarts is not recorded"""
+    tracker = kubernetes_monitoring.PodLifecycleTracker(lambda node: "ng-1")
+    tracker.observe("ADDED", _lifecycle_pod("uid-1", 2, 600, "Running", restarts=3))
+    tracker.observe("ADDED", _lifecycle_pod("uid-2", 2, 5, "Running"))
+    tracker.observe("MODIFIED", _lifecycle_pod("uid-2", 2, 900, "Running", restarts=1))
+
+    stats = tracker.rows()[0][3]
+    assert stats["scheduled"][0] == 2
+    assert stats["ready"][0] == 1
+    assert abs(stats["ready"][1] - 3) < 0.1
+
+
+class _BlockingWatch:
+    """Watch stand-in whose stream blocks until its response is closed"""
+
+    instances = []
+
+    def __init__(self):
+        self.resource_version = None
+        self.closed = threading.Event()
+        self.finished = threading.Event()
+        self._resp = MagicMock()
+        self._resp.close.side_effect = self.closed.set
+        _BlockingWatch.instances.append(self)
+
+    def stop(self):
+        pass
+
+    def stream(self, func, **kwargs):
+        try:
+            self.closed.wait(5)
+            return
+            yield
+        finally:
+            self.finished.set()
+
+
+def _run_latency_view(targets):
+    mock_v1 = MagicMock()
+    mock_v1.list_namespaced_pod.return_value = MagicMock(items=[])
+    with patch.object(
+        kubernetes_monitoring, "_pod_watch_targets", return_value=targets
+    ), patch.object(
+        kubernetes_monitoring, "choose_namespaces", return_value=None
+    ), patch.object(kubernetes_monitoring, "load_kube_config"), patch.object(
+        kubernetes_monitoring, "client"
+    ) as mock_client, patch.object(
+        kubernetes_monitoring.Prompt, "ask", return_value="10"
+    ), patch.object(kubernetes_monitoring.console, "clear"), patch(
+        "kubernetes_monitoring.time.sleep", side_effect=KeyboardInterrupt
+    ):
+        mock_client.CoreV1Api.return_value = mock_v1
+        kubernetes_monitoring.watch_pod_lifecycle_latency()
+    return mock_v1
+
+
+@patch("kubernetes_monitoring.watch")
+def test_latency_view_closes_watch_streams_on_exit(mock_watch):
+    """Test that leaving the view ends blocked watch streams promptly"""
+    _BlockingWatch.instances = []
+    mock_watch.Watch.side_effect = _BlockingWatch
+
+    _run_latency_view(["team-a"])
+
+    assert len(_BlockingWatch.instances) == 1
+    assert _BlockingWatch.instances[0].finished.wait(1)
+
+
+@patch("kubernetes_monitoring.threading.Thread")
+def test_latency_view_polls_instead_of_watching_many_namespaces(mock_thread):
+    """Test that more namespaces than the shard limit use a single poller"""
+    many = [
+        f"ns-{i}" for i in range(kubernetes_monitoring.NAMESPACE_SHARD_CONCURRENCY + 1)
+    ]
+    _run_latency_view(many)
+    assert mock_thread.call_count == 1
+    assert mock_thread.call_args.kwargs["target"].__name__ == "_poll"
+
+    mock_thread.reset_mock()
+    _run_latency_view(["team-a", "team-b"])
+    assert mock_thread.call_count == 2